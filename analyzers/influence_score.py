@@ -63,21 +63,29 @@ def calculate_signal_score(x_df, yt_df, chart_df=None):
 
     all_celebs = x_celebs | yt_celebs | chart_celebs
 
+    # Split each source by artist ONCE up front. Filtering the whole table
+    # with df[df['celebrity'] == name] inside the loop rescans every row for
+    # every artist, which grows as (artists x rows).
+    x_groups = dict(tuple(x_df.groupby('celebrity', sort=False, observed=True))) if not x_df.empty else {}
+    yt_groups = dict(tuple(yt_df.groupby('celebrity', sort=False, observed=True))) if not yt_df.empty else {}
+    chart_groups = dict(tuple(chart_df.groupby('celebrity', sort=False, observed=True))) if chart_celebs else {}
+
+    # Category lookup: X wins over YouTube, which wins over charts, so fill
+    # the dict in reverse priority and let later sources overwrite.
+    category_map = {}
+    for groups in (chart_groups, yt_groups, x_groups):
+        for name, group in groups.items():
+            category_map[name] = group['category'].iloc[0]
+
     for celebrity in all_celebs:
         # Determine category
-        category = 'Other'
-        if not x_df.empty and not x_df[x_df['celebrity'] == celebrity].empty:
-            category = x_df[x_df['celebrity'] == celebrity]['category'].iloc[0]
-        elif not yt_df.empty and not yt_df[yt_df['celebrity'] == celebrity].empty:
-            category = yt_df[yt_df['celebrity'] == celebrity]['category'].iloc[0]
-        elif chart_df is not None and not chart_df.empty and not chart_df[chart_df['celebrity'] == celebrity].empty:
-            category = chart_df[chart_df['celebrity'] == celebrity]['category'].iloc[0]
+        category = category_map.get(celebrity, 'Other')
 
         # ========================================
         # X METRICS CALCULATION
         # ========================================
 
-        celeb_x = x_df[x_df['celebrity'] == celebrity] if not x_df.empty else pd.DataFrame()
+        celeb_x = x_groups.get(celebrity, pd.DataFrame())
 
         if not celeb_x.empty:
             avg_engagement = celeb_x['engagement'].mean()
@@ -103,7 +111,7 @@ def calculate_signal_score(x_df, yt_df, chart_df=None):
         # YOUTUBE METRICS CALCULATION
         # ========================================
 
-        celeb_yt = yt_df[yt_df['celebrity'] == celebrity] if not yt_df.empty else pd.DataFrame()
+        celeb_yt = yt_groups.get(celebrity, pd.DataFrame())
 
         if not celeb_yt.empty:
             total_views = celeb_yt['views'].sum()
@@ -120,7 +128,7 @@ def calculate_signal_score(x_df, yt_df, chart_df=None):
         # CHART METRICS CALCULATION (NEW!)
         # ========================================
 
-        celeb_chart = chart_df[chart_df['celebrity'] == celebrity] if chart_df is not None and not chart_df.empty else pd.DataFrame()
+        celeb_chart = chart_groups.get(celebrity, pd.DataFrame())
 
         if not celeb_chart.empty:
             # Get chart positions (lower number = better position)
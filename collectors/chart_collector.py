@@ -11,6 +11,7 @@ DATA SOURCES:
 IMPORTANT: This collector respects robots.txt and includes delays between requests
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
@@ -223,21 +224,52 @@ def scrape_melon_chart(artist_name):
         return None
 
 
+def _scrape_site(site_sources, names):
+    """
+    Run every chart scraper for one website over all artist names, printing
+    each result as it comes in (prefixed with the chart label, since the
+    sites run side by side)
+
+    Returns: dict of artist name -> combined chart data from this site
+
+    Tech note: Each website gets exactly one thread (see collect_chart_data),
+    so its requests still go out one at a time, spaced by the delay inside
+    _make_request plus the pause between artists.
+    """
+    results = {}
+    for idx, name in enumerate(names, 1):
+        artist_data = {}
+        for label, key, scraper in site_sources:
+            data = scraper(name)
+            if data:
+                artist_data.update(data)
+                status = f"#{data[key]}" if data.get(key) else "Not charting"
+            else:
+                status = "Failed"
+            print(f"    [{label} {idx}/{len(names)}] {name}: {status}")
+        results[name] = artist_data
+
+        # Respectful delay between artists
+        time.sleep(2)
+    return results
+
+
 def collect_chart_data():
     """
     Main function to collect chart data for all active artists
 
     What this does:
     1. Loads active artists from artists.json
-    2. For each artist, scrapes multiple chart sources
+    2. Scrapes each chart website for every artist, one thread per website
     3. Combines all data into a single DataFrame
     4. Returns the data for saving
 
     Returns: pandas DataFrame with chart data
 
-    Tech note: This function is designed to run quickly (15-30 mins)
-    compared to X API collection (7-8 hours) because web scraping
-    doesn't have the same rate limits.
+    Tech note: Scraping is almost all waiting on the network, so running
+    the three websites side by side makes the whole run take about as long
+    as the slowest website instead of the sum of all of them. Both Billboard
+    charts share one thread because they hit the same site.
     """
 
     artists = load_artists()
@@ -247,77 +279,42 @@ def collect_chart_data():
         return pd.DataFrame()
 
     print(f"📊 Collecting chart data for {len(artists)} artists")
-    print("   This will take 15-30 minutes (web scraping, not APIs)")
+    print("   Scraping Kworb (Spotify), Billboard and Melon in parallel, one request at a time per site")
+
+    names = [artist['name'] for artist in artists]
+    kpop_names = [artist['name'] for artist in artists if artist.get('category', 'Other') == 'K-pop']
+
+    # One entry per website: ([(label, result key, scraper), ...], artists to check)
+    sites = [
+        ([('Spotify', 'spotify_position', scrape_kworb_spotify)], names),
+        ([('Billboard Hot 100', 'billboard_hot100', scrape_billboard_hot100),
+          ('Billboard 200', 'billboard_200', scrape_billboard_200)], names),
+        # Melon is a Korean chart, so only check K-pop artists
+        ([('Melon', 'melon_position', scrape_melon_chart)], kpop_names),
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(sites)) as executor:
+        futures = [executor.submit(_scrape_site, site_sources, site_names)
+                   for site_sources, site_names in sites]
+        results = [future.result() for future in futures]
 
     all_data = []
+    today = datetime.now().strftime('%Y-%m-%d')
 
-    for idx, artist in enumerate(artists, 1):
+    for artist in artists:
         name = artist['name']
-        category = artist.get('category', 'Other')
-
-        print(f"\n  [{idx}/{len(artists)}] {name}...")
 
-        # Collect data from each source
         chart_data = {
             'celebrity': name,
-            'category': category,
-            'date': datetime.now().strftime('%Y-%m-%d'),
+            'category': artist.get('category', 'Other'),
+            'date': today,
         }
 
-        # Kworb (Spotify data)
-        print(f"    ⏳ Checking Spotify charts...", end='')
-        spotify_data = scrape_kworb_spotify(name)
-        if spotify_data:
-            chart_data.update(spotify_data)
-            if spotify_data.get('spotify_position'):
-                print(f" #{spotify_data['spotify_position']}")
-            else:
-                print(" Not charting")
-        else:
-            print(" Failed")
-
-        # Billboard Hot 100
-        print(f"    ⏳ Checking Billboard Hot 100...", end='')
-        hot100_data = scrape_billboard_hot100(name)
-        if hot100_data:
-            chart_data.update(hot100_data)
-            if hot100_data.get('billboard_hot100'):
-                print(f" #{hot100_data['billboard_hot100']}")
-            else:
-                print(" Not charting")
-        else:
-            print(" Failed")
-
-        # Billboard 200 (Albums)
-        print(f"    ⏳ Checking Billboard 200...", end='')
-        bb200_data = scrape_billboard_200(name)
-        if bb200_data:
-            chart_data.update(bb200_data)
-            if bb200_data.get('billboard_200'):
-                print(f" #{bb200_data['billboard_200']}")
-            else:
-                print(" Not charting")
-        else:
-            print(" Failed")
-
-        # Melon (Korean charts - only for K-pop artists)
-        if category == 'K-pop':
-            print(f"    ⏳ Checking Melon charts...", end='')
-            melon_data = scrape_melon_chart(name)
-            if melon_data:
-                chart_data.update(melon_data)
-                if melon_data.get('melon_position'):
-                    print(f" #{melon_data['melon_position']}")
-                else:
-                    print(" Not charting")
-            else:
-                print(" Failed")
+        for site_results in results:
+            chart_data.update(site_results.get(name, {}))
 
         all_data.append(chart_data)
 
-        # Respectful delay between artists
-        time.sleep(2)
-
     print(f"\n✅ Chart data collection complete!")
     return pd.DataFrame(all_data)
 
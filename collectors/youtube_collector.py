@@ -91,18 +91,23 @@ def collect_youtube_data():
                 publishedAfter=ninety_days_ago  # Extended to 90 days for better coverage
             ).execute()
 
-            # Step 2: For each video, get detailed statistics
-            for item in search_response.get('items', []):
-                video_id = item['id']['videoId']
-
-                # Get view count, likes, comments
+            # Step 2: Get detailed statistics for all the videos at once
+            # videos().list accepts a comma-separated list of IDs, so one
+            # request replaces a round-trip (and a quota unit) per video
+            video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
+            videos_by_id = {}
+            if video_ids:
                 stats_response = youtube.videos().list(
                     part='statistics,snippet',
-                    id=video_id
+                    id=','.join(video_ids)
                 ).execute()
+                videos_by_id = {video['id']: video for video in stats_response.get('items', [])}
+
+            # Walk the search results so rows stay in newest-first order
+            for video_id in video_ids:
+                video = videos_by_id.get(video_id)
 
-                if stats_response['items']:
-                    video = stats_response['items'][0]
+                if video:
                     stats = video['statistics']
 
                     # Store video data
@@ -141,11 +146,12 @@ def collect_youtube_data():
 #
 # YouTube API has a daily quota limit (10,000 units/day for free tier)
 # Each search costs ~100 units, each video details call costs ~1 unit
+# (one details call covers all of an artist's videos)
 #
 # For 10 artists × 3 videos each:
 # - 10 search calls = 1,000 units
-# - 30 video detail calls = 30 units
-# - Total = ~1,030 units (well within daily limit)
+# - 10 video detail calls = 10 units
+# - Total = ~1,010 units (well within daily limit)
 #
 # You can check your quota usage at:
 # https://console.cloud.google.com/apis/api/youtube.googleapis.com/quotas
@@ -145,6 +145,9 @@ BILLBOARD_CHARTS = [
     "u-k-songs-hotw",
 ]
 
+# Shared session so loading every Billboard chart reuses pooled connections.
+_SESSION = requests.Session()
+
 
 def _get_base_url():
     base_url = os.getenv("BILLBOARD_CHART_API_BASE_URL")
@@ -154,7 +157,7 @@ def _get_base_url():
 
 
 def _fetch_json(url, params=None):
-    response = requests.get(url, params=params, timeout=60)
+    response = _SESSION.get(url, params=params, timeout=60)
     response.raise_for_status()
     return response.json()
 
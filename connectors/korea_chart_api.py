@@ -11,6 +11,11 @@ PLATFORMS = {
 
 DEFAULT_BASE_URL = "https://korea-music-chart-api-autumn-sun-1261.fly.dev"
 
+# Every platform lives on the same host, so a shared session lets the
+# dashboard's "All" view reuse one TCP/TLS connection instead of
+# handshaking per platform.
+_SESSION = requests.Session()
+
 
 def _get_base_url():
     base_url = os.getenv("KOREA_CHART_API_BASE_URL")
@@ -20,7 +25,7 @@ def _get_base_url():
 
 
 def _fetch_json(url):
-    response = requests.get(url, timeout=30)
+    response = _SESSION.get(url, timeout=30)
     response.raise_for_status()
     return response.json()
 
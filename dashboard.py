@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
 
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from connectors.billboard_api import BILLBOARD_CHARTS, fetch_chart as fetch_billboard_chart
 from connectors.korea_chart_api import fetch_chart, PLATFORMS
@@ -10,6 +12,26 @@ from connectors.youtube_music_charts_api import fetch_music_charts
 from update_spotify_charts import fetch_global_daily
 
 
+# Charts can run to thousands of rows; only the top of the table is ever
+# read, so cap what gets serialized to the browser.
+DISPLAY_ROW_CAP = 200
+
+COMEBACK_COLUMNS = ["pub_date", "title", "link", "source"]
+
+DATA_SOURCES = [
+    "Korean Music Charts",
+    "Billboard Charts",
+    "YouTube Music Charts",
+    "Last.fm Charts",
+    "Kpop Comeback Feed",
+    "Spotify Global Daily (Kworb)"
+]
+ALL_PLATFORMS = list(PLATFORMS.keys())
+PLATFORM_OPTIONS = ["All"] + ALL_PLATFORMS
+BILLBOARD_PLACEHOLDER = "Select a chart..."
+BILLBOARD_OPTIONS = [BILLBOARD_PLACEHOLDER] + BILLBOARD_CHARTS
+
+
 st.set_page_config(
     page_title="Signal Index",
     page_icon="📊",
@@ -17,71 +39,105 @@ st.set_page_config(
 )
 
 
+# Secrets don't change while the app is running, so read them once per
+# process instead of going through st.secrets on every rerun.
+@st.cache_resource
+def load_secret(name):
+    try:
+        return st.secrets.get(name)
+    except Exception:
+        return None
+
+
+def payload_to_df(payload):
+    if not payload:
+        return pd.DataFrame()
+    if isinstance(payload, list):
+        return pd.DataFrame(payload)
+    if isinstance(payload, dict):
+        entries = payload.get("entries")
+        if isinstance(entries, list):
+            return pd.DataFrame(entries)
+        data = payload.get("data")
+        if isinstance(data, list):
+            return pd.DataFrame(data)
+        return pd.DataFrame([payload])
+    return pd.DataFrame()
+
+
+def payload_to_frame_and_csv(payload):
+    chart_df = payload_to_df(payload)
+    csv_bytes = None
+    if len(chart_df) > DISPLAY_ROW_CAP:
+        csv_bytes = chart_df.to_csv(index=False).encode("utf-8")
+    return chart_df, csv_bytes
+
+
+# The payload loaders return (payload, DataFrame, CSV bytes, error) so the
+# table and its download are built once per cache entry, not every rerun.
 @st.cache_data(ttl=60)
 def load_korea_payload(platform, refresh_key=0):
     try:
-        return fetch_chart(platform), None
+        payload = fetch_chart(platform)
+        chart_df, csv_bytes = payload_to_frame_and_csv(payload)
+        return payload, chart_df, csv_bytes, None
     except Exception as exc:
-        return None, f"{type(exc).__name__}: {exc}"
+        return None, None, None, f"{type(exc).__name__}: {exc}"
 
 
 @st.cache_data(ttl=21600)
 def load_billboard_payload(chart_name, options, refresh_key=0):
     try:
         options = options or {}
-        return fetch_billboard_chart(
+        payload = fetch_billboard_chart(
             chart_name,
             date=options.get("date"),
             year=options.get("year")
-        ), None
+        )
+        chart_df, csv_bytes = payload_to_frame_and_csv(payload)
+        return payload, chart_df, csv_bytes, None
     except Exception as exc:
-        return None, f"{type(exc).__name__}: {exc}"
+        return None, None, None, f"{type(exc).__name__}: {exc}"
 
 
 @st.cache_data(ttl=900)
 def load_youtube_payload(region_code, max_results, api_key, refresh_key=0):
     try:
-        return fetch_music_charts(
+        payload = fetch_music_charts(
             region_code=region_code,
             max_results=max_results,
             api_key=api_key
-        ), None
+        )
+        chart_df, csv_bytes = payload_to_frame_and_csv(payload)
+        return payload, chart_df, csv_bytes, None
     except Exception as exc:
-        return None, f"{type(exc).__name__}: {exc}"
+        return None, None, None, f"{type(exc).__name__}: {exc}"
 
 
 @st.cache_data(ttl=3600)
 def load_lastfm_payload(chart_type, limit, api_key, refresh_key=0):
     try:
         if chart_type == "Top Artists":
-            return fetch_top_artists(limit=limit, api_key=api_key), None
-        if chart_type == "Top Tracks":
-            return fetch_top_tracks(limit=limit, api_key=api_key), None
-        return None, "Unknown Last.fm chart type."
+            payload = fetch_top_artists(limit=limit, api_key=api_key)
+        elif chart_type == "Top Tracks":
+            payload = fetch_top_tracks(limit=limit, api_key=api_key)
+        else:
+            return None, None, None, "Unknown Last.fm chart type."
+        chart_df, csv_bytes = payload_to_frame_and_csv(payload)
+        return payload, chart_df, csv_bytes, None
     except Exception as exc:
-        return None, f"{type(exc).__name__}: {exc}"
-
-
-def payload_to_df(payload):
-    if not payload:
-        return pd.DataFrame()
-    if isinstance(payload, list):
-        return pd.DataFrame(payload)
-    if isinstance(payload, dict):
-        entries = payload.get("entries")
-        if isinstance(entries, list):
-            return pd.DataFrame(entries)
-        data = payload.get("data")
-        if isinstance(data, list):
-            return pd.DataFrame(data)
-        return pd.DataFrame([payload])
-    return pd.DataFrame()
+        return None, None, None, f"{type(exc).__name__}: {exc}"
 
 
 @st.cache_data(ttl=900)
 def load_comeback_feed(csv_path="data/comeback_feed.csv"):
     try:
-        df = pd.read_csv(csv_path)
+        # Only read the columns the table shows.
+        df = pd.read_csv(
+            csv_path,
+            usecols=lambda col: col in COMEBACK_COLUMNS,
+            dtype={"title": "string", "link": "string", "source": "string"}
+        )
     except FileNotFoundError:
         return pd.DataFrame()
     except Exception as exc:
@@ -92,7 +148,9 @@ def load_comeback_feed(csv_path="data/comeback_feed.csv"):
         return df
 
     if "pub_date" in df.columns:
-        df["pub_date"] = pd.to_datetime(df["pub_date"], errors="coerce", utc=True)
+        df["pub_date"] = pd.to_datetime(
+            df["pub_date"], format="ISO8601", errors="coerce", utc=True
+        )
         df = df.sort_values("pub_date", ascending=False)
 
     return df
@@ -133,23 +191,12 @@ def load_spotify_global_daily(csv_path="data/spotify_global_daily_latest.csv", f
 st.title("Signal Index")
 st.caption("Live Korea + Billboard + YouTube + Last.fm chart API data (no database).")
 
-all_platforms = list(PLATFORMS.keys())
-request_type = st.sidebar.radio(
-    "Data Source",
-    [
-        "Korean Music Charts",
-        "Billboard Charts",
-        "YouTube Music Charts",
-        "Last.fm Charts",
-        "Kpop Comeback Feed",
-        "Spotify Global Daily (Kworb)"
-    ]
-)
+request_type = st.sidebar.radio("Data Source", DATA_SOURCES)
 
 if request_type == "Korean Music Charts":
     platform_choice = st.sidebar.selectbox(
         "Platform",
-        ["All"] + all_platforms
+        PLATFORM_OPTIONS
     )
     platform = None if platform_choice == "All" else platform_choice
     billboard_date = None
@@ -174,10 +221,10 @@ else:
     if request_type == "Billboard Charts":
         chart_choice = st.sidebar.radio(
             "Billboard Charts",
-            ["Select a chart..."] + BILLBOARD_CHARTS,
+            BILLBOARD_OPTIONS,
             index=0
         )
-        platform = None if chart_choice == "Select a chart..." else chart_choice
+        platform = None if chart_choice == BILLBOARD_PLACEHOLDER else chart_choice
         billboard_date = st.sidebar.text_input("Billboard date (YYYY-MM-DD)", value="").strip()
         billboard_year = st.sidebar.text_input("Billboard year (YYYY)", value="").strip()
         youtube_region = None
@@ -212,6 +259,8 @@ if st.sidebar.button("Refresh"):
 refresh_key = st.session_state.get("live_refresh", 0)
 
 payloads = {}
+frames = {}
+csv_downloads = {}
 errors = {}
 
 if request_type == "Kpop Comeback Feed":
@@ -220,7 +269,7 @@ if request_type == "Kpop Comeback Feed":
     if comeback_df.empty:
         st.info("No comeback feed data yet. Run the RSS workflow to populate.")
     else:
-        columns = [col for col in ["pub_date", "title", "link", "source"] if col in comeback_df.columns]
+        columns = [col for col in COMEBACK_COLUMNS if col in comeback_df.columns]
         st.dataframe(comeback_df[columns].head(50), use_container_width=True)
 elif request_type == "Spotify Global Daily (Kworb)":
     st.subheader("Spotify Global Daily (Kworb)")
@@ -243,27 +292,46 @@ elif platform is None and request_type == "Billboard Charts":
     st.info("Select a Billboard chart from the sidebar to load data.")
 elif platform is None:
     if request_type == "Korean Music Charts":
-        platform_keys = all_platforms
+        platform_keys = ALL_PLATFORMS
     else:
         platform_keys = BILLBOARD_CHARTS
+    options = {
+        "date": billboard_date or None,
+        "year": None if billboard_date else (billboard_year or None)
+    }
+
+    def fetch_platform(platform_key):
+        if request_type == "Billboard Charts":
+            return load_billboard_payload(platform_key, options, refresh_key)
+        return load_korea_payload(platform_key, refresh_key)
+
     total = len(platform_keys)
     progress = st.progress(0)
     status = st.empty()
-    for current, platform_key in enumerate(platform_keys, start=1):
-        status.text(f"Loading {platform_key} ({current}/{total})...")
-        progress.progress(current / total)
-        if request_type == "Billboard Charts":
-            options = {
-                "date": billboard_date or None,
-                "year": None if billboard_date else (billboard_year or None)
-            }
-            payload, error = load_billboard_payload(platform_key, options, refresh_key)
-        else:
-            payload, error = load_korea_payload(platform_key, refresh_key)
+    results = {}
+    # Each fetch is an HTTP round-trip that releases the GIL, so running them
+    # on a thread pool costs roughly one round-trip instead of one per
+    # platform. Worker threads get the script context so the cached loaders
+    # can still talk to Streamlit.
+    with ThreadPoolExecutor(
+        max_workers=8,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx())
+    ) as executor:
+        futures = {executor.submit(fetch_platform, key): key for key in platform_keys}
+        for current, future in enumerate(as_completed(futures), start=1):
+            platform_key = futures[future]
+            results[platform_key] = future.result()
+            status.text(f"Loaded {platform_key} ({current}/{total})...")
+            progress.progress(current / total)
+    for platform_key in platform_keys:
+        payload, chart_df, csv_bytes, error = results[platform_key]
         if error:
             errors[platform_key] = error
         else:
             payloads[platform_key] = payload
+            frames[platform_key] = chart_df
+            csv_downloads[platform_key] = csv_bytes
     status.empty()
     progress.empty()
 else:
@@ -272,14 +340,10 @@ else:
             "date": billboard_date or None,
             "year": None if billboard_date else (billboard_year or None)
         }
-        payload, error = load_billboard_payload(platform, options, refresh_key)
+        payload, chart_df, csv_bytes, error = load_billboard_payload(platform, options, refresh_key)
     elif request_type == "YouTube Music Charts":
-        api_key = None
-        try:
-            api_key = st.secrets.get("YOUTUBE_API_KEY")
-        except Exception:
-            api_key = None
-        payload, error = load_youtube_payload(
+        api_key = load_secret("YOUTUBE_API_KEY")
+        payload, chart_df, csv_bytes, error = load_youtube_payload(
             youtube_region or "US",
             youtube_max_results or 50,
             api_key,
@@ -287,12 +351,8 @@ else:
         )
         platform = "YouTube Music Charts"
     elif request_type == "Last.fm Charts":
-        api_key = None
-        try:
-            api_key = st.secrets.get("LASTFM_API_KEY")
-        except Exception:
-            api_key = None
-        payload, error = load_lastfm_payload(
+        api_key = load_secret("LASTFM_API_KEY")
+        payload, chart_df, csv_bytes, error = load_lastfm_payload(
             lastfm_chart_type or "Top Artists",
             lastfm_limit or 50,
             api_key,
@@ -300,11 +360,13 @@ else:
         )
         platform = "Last.fm Charts"
     else:
-        payload, error = load_korea_payload(platform, refresh_key)
+        payload, chart_df, csv_bytes, error = load_korea_payload(platform, refresh_key)
     if error:
         errors[platform] = error
     else:
         payloads[platform] = payload
+        frames[platform] = chart_df
+        csv_downloads[platform] = csv_bytes
 
 if errors:
     for platform_key, message in errors.items():
@@ -323,13 +385,24 @@ if payloads:
             st.subheader(platform_key)
         else:
             st.subheader(f"{platform_key.capitalize()} Chart")
-        chart_df = payload_to_df(payload)
+        chart_df = frames[platform_key]
         if chart_df.empty:
             st.info("No data returned.")
         else:
-            st.dataframe(chart_df, use_container_width=True)
-
-        with st.expander(f"Raw response: {platform_key}"):
+            st.dataframe(chart_df.head(DISPLAY_ROW_CAP), use_container_width=True, hide_index=True)
+            if len(chart_df) > DISPLAY_ROW_CAP:
+                st.caption(f"Showing {DISPLAY_ROW_CAP} of {len(chart_df)} rows")
+                st.download_button(
+                    "Download full CSV",
+                    csv_downloads[platform_key],
+                    file_name=f"{platform_key}.csv",
+                    mime="text/csv",
+                    key=f"csv_{platform_key}"
+                )
+
+        # st.expander ships its contents even while collapsed, so gate the
+        # raw JSON behind a toggle and only serialize it when asked for.
+        if st.toggle(f"Raw response: {platform_key}", key=f"raw_{platform_key}"):
             st.json(payload)
 elif request_type not in ("Kpop Comeback Feed", "Spotify Global Daily (Kworb)"):
     st.info("No data returned.")
@@ -1,27 +1,76 @@
 import json
-from sqlalchemy import delete
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from sqlalchemy import delete, select
 from config import load_metrics_config, load_watchlist, load_rss_sources
 from db import get_engine, get_session, init_db, Person, Observation
 from metrics import normalize_value
 from connectors.lastfm import fetch_artist_stats
 from connectors.korea_chart_api import fetch_chart, PLATFORMS
 from datetime import date
-from sqlalchemy import and_
+from sqlalchemy import and_, tuple_
 from connectors.rss_koreansales import parse_items
 import requests
-from bs4 import BeautifulSoup
-from io import StringIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from io import BytesIO
+from lxml import etree
+import orjson
 import pandas as pd
 
 
+CSV_ITEM_COLUMNS = {
+    "Title": "title",
+    "Description": "description",
+    "Date": "pubDate"
+}
+
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "SignalIndexRSS/1.0"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+)
+
+NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+LASTFM_RAW_JSON = json.dumps({"lastfm": True})
+RSS_RAW_JSON = json.dumps({"rss": True})
+
+# Keeps each DELETE's bound parameters (3 per key) under SQLite's 999 limit.
+DELETE_BATCH_SIZE = 300
+# Nine observation columns per row, so 100 rows per INSERT stays under it too.
+INSERT_CHUNK_SIZE = 100
+
+# Last.fm allows 5 requests per second per IP; stay just under it.
+LASTFM_MAX_WORKERS = 3
+LASTFM_MIN_INTERVAL = 0.25
+_LASTFM_LOCK = threading.Lock()
+_lastfm_next_call = 0.0
+
+
+@lru_cache(maxsize=4096)
 def _normalize_key(value):
-    return "".join(ch for ch in value.lower() if ch.isalnum())
+    return NON_ALNUM_RE.sub("", value.lower())
+
+
+def _load_people_ids(session):
+    rows = session.execute(select(Person.id, Person.person_key)).all()
+    return {person_key: person_id for person_id, person_key in rows}
 
 
 def _ensure_person(session, people_map, person_key, display_name):
-    person = people_map.get(person_key)
-    if person:
-        return person
+    person_id = people_map.get(person_key)
+    if person_id:
+        return person_id
 
     person = Person(
         person_key=person_key,
@@ -31,8 +80,49 @@ def _ensure_person(session, people_map, person_key, display_name):
     )
     session.add(person)
     session.commit()
-    people_map[person_key] = person
-    return person
+    people_map[person_key] = person.id
+    return person.id
+
+
+def _replace_observations(session, rows):
+    if not rows:
+        return
+    keys = [(row["person_id"], row["metric_key"], row["date"]) for row in rows]
+    key_columns = tuple_(Observation.person_id, Observation.metric_key, Observation.date)
+    for start in range(0, len(keys), DELETE_BATCH_SIZE):
+        session.execute(
+            delete(Observation).where(
+                key_columns.in_(keys[start:start + DELETE_BATCH_SIZE])
+            )
+        )
+    pd.DataFrame(rows).to_sql(
+        Observation.__tablename__,
+        session.connection(),
+        if_exists="append",
+        index=False,
+        method="multi",
+        chunksize=INSERT_CHUNK_SIZE
+    )
+
+
+def _fetch_lastfm_stats(artist_name):
+    global _lastfm_next_call
+    with _LASTFM_LOCK:
+        now = time.monotonic()
+        wait = _lastfm_next_call - now
+        _lastfm_next_call = max(now, _lastfm_next_call) + LASTFM_MIN_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
+    try:
+        return fetch_artist_stats(artist_name), None
+    except requests.HTTPError as exc:
+        # A rejected API key fails every call; stop instead of logging each one.
+        if exc.response is not None and exc.response.status_code in (401, 403):
+            raise
+        return None, f"{type(exc).__name__}: {exc}"
+    except (requests.RequestException, ValueError) as exc:
+        return None, f"{type(exc).__name__}: {exc}"
 
 
 def _seed_people(session, watchlist):
@@ -76,18 +166,32 @@ def run_lastfm_ingest():
     metric_keys = ["lastfm_listeners", "lastfm_playcount"]
     metric_defs = {key: metrics[key] for key in metric_keys if key in metrics}
 
-    if not metric_defs:
+    if not metric_defs or not watchlist:
+        session.close()
+        return {"observations": 0, "errors": []}
+    if not os.getenv("LASTFM_API_KEY"):
         session.close()
-        return 0
+        return {
+            "observations": 0,
+            "errors": [{"source": "lastfm", "error": "LASTFM_API_KEY is not set"}]
+        }
 
-    people_map = {p.person_key: p for p in session.query(Person).all()}
-    rows_written = 0
+    people_map = _load_people_ids(session)
+    rows = {}
+    errors = []
     today = date.today()
 
-    for person in watchlist:
+    names = [person["display_name"] for person in watchlist]
+    # The first call runs here so a rejected key raises before the pool starts.
+    results = [_fetch_lastfm_stats(names[0])]
+    with ThreadPoolExecutor(max_workers=LASTFM_MAX_WORKERS) as executor:
+        results.extend(executor.map(_fetch_lastfm_stats, names[1:]))
+
+    for person, (stats, error) in zip(watchlist, results):
         person_key = person["person_key"]
-        display_name = person["display_name"]
-        stats = fetch_artist_stats(display_name)
+        if error:
+            errors.append({"source": person["display_name"], "error": error})
+            continue
         if not stats:
             continue
 
@@ -101,72 +205,77 @@ def run_lastfm_ingest():
             metric = metric_defs[key]
             value_num, value_text = normalize_value(key, value, None)
 
-            session.execute(
-                delete(Observation).where(
-                    and_(
-                        Observation.person_id == people_map[person_key].id,
-                        Observation.metric_key == key,
-                        Observation.date == today
-                    )
-                )
-            )
-
-            observation = Observation(
-                person_id=people_map[person_key].id,
-                metric_key=key,
-                pillar=metric["pillar"],
-                source=metric["source"],
-                date=today,
-                value_num=value_num,
-                value_text=value_text,
-                unit=metric["unit"],
-                raw_json=json.dumps({"lastfm": True})
-            )
-            session.add(observation)
-            rows_written += 1
+            person_id = people_map[person_key]
+            rows[(person_id, key, today)] = {
+                "person_id": person_id,
+                "metric_key": key,
+                "pillar": metric["pillar"],
+                "source": metric["source"],
+                "date": today,
+                "value_num": value_num,
+                "value_text": value_text,
+                "unit": metric["unit"],
+                "raw_json": LASTFM_RAW_JSON
+            }
 
+    _replace_observations(session, list(rows.values()))
     session.commit()
     session.close()
-    return rows_written
+    return {"observations": len(rows), "errors": errors}
 
 
 def _fetch_rss_items(url):
     try:
-        response = requests.get(
-            url,
-            timeout=30,
-            headers={"User-Agent": "SignalIndexRSS/1.0"}
-        )
+        response = _SESSION.get(url, timeout=30)
         response.raise_for_status()
     except Exception as exc:
         return [], f"{type(exc).__name__}: {exc}"
 
+    return _parse_rss_body(url, response.content)
+
+
+def _parse_rss_body(url, content):
     if url.endswith(".csv"):
         try:
-            df = pd.read_csv(StringIO(response.text))
+            df = pd.read_csv(BytesIO(content))
         except Exception as exc:
             return [], f"{type(exc).__name__}: {exc}"
 
-        items = []
-        for _, row in df.iterrows():
-            items.append({
-                "title": row.get("Title", "") or "",
-                "description": row.get("Description", "") or "",
-                "pubDate": row.get("Date", "") or ""
-            })
+        for column in CSV_ITEM_COLUMNS:
+            if column not in df.columns:
+                df[column] = ""
+        items = (
+            df[list(CSV_ITEM_COLUMNS)]
+            .fillna("")
+            .rename(columns=CSV_ITEM_COLUMNS)
+            .to_dict(orient="records")
+        )
         return items, None
 
-    soup = BeautifulSoup(response.text, "xml")
     items = []
-    for item in soup.find_all("item"):
-        items.append({
-            "title": item.title.get_text(strip=True) if item.title else "",
-            "description": item.description.get_text() if item.description else "",
-            "pubDate": item.pubDate.get_text(strip=True) if item.pubDate else ""
-        })
+    try:
+        for _, item in etree.iterparse(BytesIO(content), tag="item", recover=True):
+            items.append({
+                "title": (item.findtext("title") or "").strip(),
+                "description": item.findtext("description") or "",
+                "pubDate": (item.findtext("pubDate") or "").strip()
+            })
+            item.clear()
+            while item.getprevious() is not None:
+                del item.getparent()[0]
+    except Exception as exc:
+        return [], f"{type(exc).__name__}: {exc}"
     return items, None
 
 
+def _parse_feeds(items_per_source):
+    if len(items_per_source) < 2:
+        return [parse_items(items) for items in items_per_source]
+    max_workers = min(len(items_per_source), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(parse_items, items_per_source))
+
+
 def run_rss_ingest():
     engine = init_db(get_engine())
     session = get_session(engine)
@@ -177,13 +286,12 @@ def run_rss_ingest():
 
     _seed_people(session, watchlist)
 
-    people_map = {p.person_key: p for p in session.query(Person).all()}
-    person_lookup = {}
-    for person in watchlist:
-        display_name = person["display_name"]
-        person_key = person["person_key"]
-        person_lookup[_normalize_key(display_name)] = person_key
-        person_lookup[_normalize_key(person_key)] = person_key
+    people_map = _load_people_ids(session)
+    person_lookup = {
+        _normalize_key(alias): person["person_key"]
+        for person in watchlist
+        for alias in (person["display_name"], person["person_key"])
+    }
 
     observations = {}
     items_total = 0
@@ -192,15 +300,18 @@ def run_rss_ingest():
     sample_titles = []
     csv_rows = []
 
-    for source in sources:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        fetched = list(executor.map(_fetch_rss_items, [source["url"] for source in sources]))
+    parsed_lists = iter(_parse_feeds([items for items, error in fetched if not error]))
+
+    for source, (items, error) in zip(sources, fetched):
         url = source["url"]
-        items, error = _fetch_rss_items(url)
         if error:
             errors.append({"source": source.get("label", url), "error": error})
             continue
 
         items_total += len(items)
-        parsed = parse_items(items)
+        parsed = next(parsed_lists)
         parsed_total += len(parsed)
         sample_titles.extend([item["title"] for item in items[:3]])
         for entry in parsed:
@@ -210,10 +321,10 @@ def run_rss_ingest():
 
             normalized_tag = _normalize_key(entry["tag"])
             person_key = person_lookup.get(normalized_tag, normalized_tag)
-            person = _ensure_person(session, people_map, person_key, entry["tag"])
+            person_id = _ensure_person(session, people_map, person_key, entry["tag"])
 
             metric = metrics[metric_key]
-            key = (person.id, metric_key, entry["date"])
+            key = (person_id, metric_key, entry["date"])
             value_num = entry["value_num"]
             if key in observations:
                 current = observations[key]["value_num"]
@@ -223,7 +334,7 @@ def run_rss_ingest():
                     value_num = max(current, value_num)
 
             observations[key] = {
-                "person_id": person.id,
+                "person_id": person_id,
                 "metric_key": metric_key,
                 "pillar": metric["pillar"],
                 "source": metric["source"],
@@ -232,7 +343,7 @@ def run_rss_ingest():
                 "unit": metric["unit"]
             }
             csv_rows.append({
-                "person_key": person.person_key,
+                "person_key": person_key,
                 "metric_key": metric_key,
                 "date": entry["date"],
                 "value_num": value_num,
@@ -240,30 +351,12 @@ def run_rss_ingest():
                 "raw_text": entry.get("raw", "")
             })
 
-    rows_written = 0
-    for (_, metric_key, date_value), data in observations.items():
-        session.execute(
-            delete(Observation).where(
-                and_(
-                    Observation.person_id == data["person_id"],
-                    Observation.metric_key == metric_key,
-                    Observation.date == date_value
-                )
-            )
-        )
-        observation = Observation(
-            person_id=data["person_id"],
-            metric_key=metric_key,
-            pillar=data["pillar"],
-            source=data["source"],
-            date=data["date"],
-            value_num=data["value_num"],
-            value_text=None,
-            unit=data["unit"],
-            raw_json=json.dumps({"rss": True})
-        )
-        session.add(observation)
-        rows_written += 1
+    rows = [
+        dict(data, value_text=None, raw_json=RSS_RAW_JSON)
+        for data in observations.values()
+    ]
+    _replace_observations(session, rows)
+    rows_written = len(rows)
 
     if csv_rows:
         pd.DataFrame(csv_rows).to_csv("data/rss_observations.csv", index=False)
@@ -288,7 +381,7 @@ def run_chart_api_ingest():
 
     _seed_people(session, watchlist)
 
-    people_map = {p.person_key: p for p in session.query(Person).all()}
+    people_map = _load_people_ids(session)
     today = date.today()
     rows_written = 0
 
@@ -315,12 +408,12 @@ def run_chart_api_ingest():
                 continue
 
             normalized_tag = _normalize_key(artist_name)
-            person = _ensure_person(session, people_map, normalized_tag, artist_name)
+            person_id = _ensure_person(session, people_map, normalized_tag, artist_name)
 
             session.execute(
                 delete(Observation).where(
                     and_(
-                        Observation.person_id == person.id,
+                        Observation.person_id == person_id,
                         Observation.metric_key == metric_key,
                         Observation.date == today
                     )
@@ -328,7 +421,7 @@ def run_chart_api_ingest():
             )
 
             observation = Observation(
-                person_id=person.id,
+                person_id=person_id,
                 metric_key=metric_key,
                 pillar=metric["pillar"],
                 source=metric["source"],
@@ -336,7 +429,7 @@ def run_chart_api_ingest():
                 value_num=rank,
                 value_text=None,
                 unit=metric["unit"],
-                raw_json=json.dumps(entry)
+                raw_json=orjson.dumps(entry).decode()
             )
             session.add(observation)
             rows_written += 1
@@ -69,8 +69,8 @@ def data_health(df, metrics_config):
         .reset_index()
         .rename(columns={"date": "last_date"})
     )
-    today = date.today()
-    latest_dates["days_since"] = latest_dates["last_date"].apply(lambda d: (today - d).days)
+    today = pd.Timestamp(date.today())
+    latest_dates["days_since"] = (today - pd.to_datetime(latest_dates["last_date"])).dt.days
     latest_dates["display_name"] = latest_dates["metric_key"].map(
         lambda key: metrics_config[key]["display_name"]
     )
@@ -0,0 +1,33 @@
+"""
+Signal Index - Charts + Social Data in One Run
+
+What it does:
+1. Runs the chart collection from update_charts.py
+2. Runs the X/YouTube collection from update_data.py
+3. Hands the chart DataFrame straight to the scoring step
+
+How to run:
+    python update_all.py
+
+Why use this instead of running both scripts?
+    update_data.py normally re-reads data/chart_data.csv from disk.
+    Running both in one process skips that read - the chart data is
+    already in memory. Both CSVs are still written for the dashboard.
+
+Outputs:
+    Same as update_charts.py + update_data.py
+"""
+
+import update_charts
+import update_data
+
+
+def main():
+    chart_df = update_charts.main()
+    # An empty scrape falls back to the last saved chart_data.csv, exactly
+    # as it would when the two scripts run separately.
+    update_data.main(chart_df=chart_df if not chart_df.empty else None)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,9 +21,7 @@ Outputs:
     data/chart_data.csv - Chart positions and streaming data
 """
 
-import pandas as pd
 from datetime import datetime
-from collectors.chart_collector import collect_chart_data
 import os
 
 
@@ -38,6 +36,9 @@ def main():
 
     Tech note: This runs independently of update_data.py, so you can
     refresh chart data without waiting for X API rate limits.
+
+    Returns the chart DataFrame (empty if nothing was collected) so
+    update_all.py can hand it straight to update_data.main().
     """
 
     # Header
@@ -49,6 +50,11 @@ def main():
     # Create data directory if it doesn't exist
     os.makedirs('data', exist_ok=True)
 
+    # Imported here so the header shows up straight away instead of after
+    # pandas, requests and BeautifulSoup have loaded
+    import pandas as pd
+    from collectors.chart_collector import collect_chart_data
+
     # ========================================
     # STAGE 1: Collect Chart Data
     # ========================================
@@ -65,7 +71,7 @@ def main():
         print("   • Network issues")
         print("   • Chart sites are down")
         print("   • HTML structure changed (needs code update)")
-        return
+        return chart_df
 
     # ========================================
     # STAGE 2: Save Data
@@ -98,10 +104,12 @@ def main():
     if spotify_count > 0:
         print(f"\n🎵 Top 5 on Spotify:")
         top_spotify = chart_df[chart_df['spotify_position'].notna()].nsmallest(5, 'spotify_position')
-        for idx, row in top_spotify.iterrows():
-            pos = row['spotify_position']
-            name = row['celebrity']
-            streams = row.get('spotify_streams', 0)
+        # itertuples hands back lightweight namedtuples instead of building
+        # a full Series per row like iterrows does
+        for row in top_spotify.itertuples(index=False):
+            pos = row.spotify_position
+            name = row.celebrity
+            streams = getattr(row, 'spotify_streams', 0)
             if streams:
                 streams_formatted = f"{int(streams):,}" if pd.notna(streams) else "N/A"
                 print(f"   #{int(pos):>2}. {name:<20} {streams_formatted} streams")
@@ -112,9 +120,9 @@ def main():
     if billboard_hot100_count > 0:
         print(f"\n🔥 Top 5 on Billboard Hot 100:")
         top_billboard = chart_df[chart_df['billboard_hot100'].notna()].nsmallest(5, 'billboard_hot100')
-        for idx, row in top_billboard.iterrows():
-            pos = row['billboard_hot100']
-            name = row['celebrity']
+        for row in top_billboard.itertuples(index=False):
+            pos = row.billboard_hot100
+            name = row.celebrity
             print(f"   #{int(pos):>2}. {name}")
 
     print("\n✨ Chart data collection complete!")
@@ -122,6 +130,8 @@ def main():
     print("▶️  Or: Run 'streamlit run dashboard.py' to view rankings")
     print("=" * 60)
 
+    return chart_df
+
 
 # ========================================
 # SCRIPT ENTRY POINT
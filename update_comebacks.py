@@ -6,21 +6,78 @@ Run:
 
 Output:
     data/comeback_feed.csv
+    data/comeback_feed.meta.json (ETag/Last-Modified per feed, last compaction)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 import html
+from html.entities import html5 as HTML5_ENTITIES
+import json
 import os
-import xml.etree.ElementTree as ET
+import re
+from urllib.parse import urlparse
 
+from lxml import etree
 import pandas as pd
 import requests
 
 
-RSS_URL = "https://kpopofficial.com/category/kpop-comeback-schedule/feed/"
+RSS_URLS = [
+    "https://kpopofficial.com/category/kpop-comeback-schedule/feed/",
+]
 OUTPUT_PATH = "data/comeback_feed.csv"
+META_PATH = "data/comeback_feed.meta.json"
 RETENTION_DAYS = 90
+COMPACT_EVERY_DAYS = 7
+NAMED_ENTITY_RE = re.compile(rb"&([A-Za-z][A-Za-z0-9]{1,31});")
+XML_ENTITIES = {b"amp", b"lt", b"gt", b"quot", b"apos"}
+
+
+def load_feed_meta():
+    # Without the CSV, cached validators would 304 forever and never rebuild it.
+    if not os.path.exists(OUTPUT_PATH):
+        return {}
+    try:
+        with open(META_PATH, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_feed_meta(meta):
+    with open(META_PATH, "w", encoding="utf-8") as handle:
+        json.dump(meta, handle, indent=2)
+
+
+def load_seen_keys():
+    try:
+        seen_df = pd.read_csv(OUTPUT_PATH, usecols=["title", "link"]).dropna()
+    except (FileNotFoundError, ValueError):
+        return set()
+    return set(zip(seen_df["title"], seen_df["link"]))
+
+
+def compaction_due(meta):
+    last_compacted = meta.get("last_compacted")
+    if not last_compacted:
+        return True
+    age = datetime.now(timezone.utc).date() - datetime.fromisoformat(last_compacted).date()
+    return age.days >= COMPACT_EVERY_DAYS
+
+
+def append_items(items, seen_keys):
+    cutoff = datetime.now(timezone.utc) - timedelta(days=RETENTION_DAYS)
+    items = items.dropna(subset=["title", "link"]).drop_duplicates(subset=["title", "link"])
+    is_new = pd.Series(
+        [key not in seen_keys for key in zip(items["title"], items["link"])],
+        index=items.index,
+        dtype=bool
+    )
+    new_items = items[is_new & (items["pub_date"] >= cutoff)]
+    new_items.to_csv(OUTPUT_PATH, mode="a", header=False, index=False)
+    return new_items
 
 
 def _parse_pub_date(value):
@@ -30,36 +87,104 @@ def _parse_pub_date(value):
         dt = parsedate_to_datetime(value)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
-        return dt
+        return dt.astimezone(timezone.utc)
     except (TypeError, ValueError):
         return None
 
 
-def fetch_rss_items():
-    response = requests.get(RSS_URL, timeout=30)
-    response.raise_for_status()
-
-    safe_text = html.unescape(response.text)
-    root = ET.fromstring(safe_text)
-    channel = root.find("channel")
-    if channel is None:
-        return []
-
-    items = []
-    for item in channel.findall("item"):
-        title = item.findtext("title") or ""
-        link = item.findtext("link") or ""
-        pub_date_raw = item.findtext("pubDate") or ""
-        pub_date = _parse_pub_date(pub_date_raw)
-
-        items.append({
-            "title": title.strip(),
-            "link": link.strip(),
-            "pub_date": pub_date.isoformat() if pub_date else None,
-            "source": "kpopofficial.com",
-        })
-
-    return items
+def _numeric_entity(match):
+    name = match.group(1)
+    text = HTML5_ENTITIES.get(name.decode("ascii") + ";")
+    if name in XML_ENTITIES or text is None:
+        return match.group(0)
+    return "".join(f"&#{ord(char)};" for char in text).encode("ascii")
+
+
+class _EntityStream:
+    """Feed stream that rewrites HTML-only entities (&hellip;, &nbsp;, ...)
+    as numeric references, which lxml decodes instead of dropping."""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._pending = b""
+
+    def read(self, size=65536):
+        while True:
+            chunk = self._raw.read(size)
+            data = self._pending + chunk
+            self._pending = b""
+            if chunk:
+                # Hold back an entity split across two chunks.
+                cut = data.rfind(b"&")
+                if cut != -1 and b";" not in data[cut:] and len(data) - cut <= 33:
+                    data, self._pending = data[:cut], data[cut:]
+                if not data:
+                    continue
+            return NAMED_ENTITY_RE.sub(_numeric_entity, data)
+
+
+def fetch_rss_items(feed_validators, seen_links=frozenset()):
+    """
+    Fetch every feed in RSS_URLS.
+
+    Items whose link is in seen_links (and everything older) are skipped.
+
+    Returns (items, feed_validators). items is a DataFrame of new entries, or
+    None when every feed answered 304 Not Modified; feed_validators maps each
+    feed URL to its latest ETag/Last-Modified.
+    """
+    with ThreadPoolExecutor(max_workers=len(RSS_URLS)) as executor:
+        feeds = list(executor.map(
+            lambda url: fetch_feed_items(url, feed_validators.get(url, {}), seen_links),
+            RSS_URLS
+        ))
+
+    updated_validators = {url: validators for url, (_, validators) in zip(RSS_URLS, feeds)}
+    changed = [feed_df for feed_df, _ in feeds if feed_df is not None]
+    if not changed:
+        return None, updated_validators
+    return pd.concat(changed, ignore_index=True), updated_validators
+
+
+def fetch_feed_items(url, validators, seen_links=frozenset()):
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    with requests.get(url, headers=headers, timeout=30, stream=True) as response:
+        if response.status_code == 304:
+            return None, validators
+        response.raise_for_status()
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
+        response.raw.decode_content = True
+        items = []
+        feed = _EntityStream(response.raw)
+        for _, item in etree.iterparse(feed, tag="item", recover=True):
+            link = (item.findtext("link") or "").strip()
+            # Feeds are newest first, so everything from here on is already stored.
+            if link in seen_links:
+                break
+            title = html.unescape(item.findtext("title") or "")
+            items.append({
+                "title": title.strip(),
+                "link": link,
+                "pub_date": _parse_pub_date(item.findtext("pubDate")),
+            })
+
+            item.clear()
+            while item.getprevious() is not None:
+                del item.getparent()[0]
+
+    feed_df = pd.DataFrame(items, columns=["title", "link", "pub_date"])
+    feed_df["pub_date"] = pd.to_datetime(feed_df["pub_date"], utc=True)
+    feed_df["source"] = urlparse(url).netloc
+    return feed_df, validators
 
 
 def merge_and_trim(existing_df, new_items):
@@ -72,8 +197,13 @@ def merge_and_trim(existing_df, new_items):
     if combined.empty:
         return combined
 
-    combined["pub_date"] = pd.to_datetime(combined["pub_date"], errors="coerce", utc=True)
-    combined = combined.dropna(subset=["title", "link"]).drop_duplicates(subset=["title", "link"])
+    if not isinstance(combined["pub_date"].dtype, pd.DatetimeTZDtype):
+        combined["pub_date"] = pd.to_datetime(combined["pub_date"], errors="coerce", utc=True)
+    combined = combined.dropna(subset=["title", "link"])
+    dedupe_key = pd.util.hash_pandas_object(
+        combined[["title", "link"]].astype("string"), index=False
+    )
+    combined = combined[~dedupe_key.duplicated()]
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=RETENTION_DAYS)
     combined = combined[combined["pub_date"] >= cutoff]
@@ -84,15 +214,40 @@ def merge_and_trim(existing_df, new_items):
 def main():
     os.makedirs("data", exist_ok=True)
 
-    try:
-        existing_df = pd.read_csv(OUTPUT_PATH)
-    except FileNotFoundError:
-        existing_df = pd.DataFrame()
-
-    items = fetch_rss_items()
-    combined = merge_and_trim(existing_df, items)
-    combined.to_csv(OUTPUT_PATH, index=False)
-    print(f"Saved {len(combined)} items -> {OUTPUT_PATH}")
+    meta = load_feed_meta()
+    seen_keys = load_seen_keys()
+    items, meta["feeds"] = fetch_rss_items(
+        meta.get("feeds", {}), {link for _, link in seen_keys}
+    )
+    if items is None:
+        print(f"Feeds unchanged since last run; keeping {OUTPUT_PATH}")
+        return
+
+    same_columns = (
+        os.path.exists(OUTPUT_PATH)
+        and list(pd.read_csv(OUTPUT_PATH, nrows=0).columns) == list(items.columns)
+    )
+    if same_columns and not compaction_due(meta):
+        appended = append_items(items, seen_keys)
+        print(f"Appended {len(appended)} new items -> {OUTPUT_PATH}")
+    else:
+        try:
+            existing_df = pd.read_csv(
+                OUTPUT_PATH,
+                dtype={"title": "string", "link": "string", "source": "category"},
+                parse_dates=["pub_date"],
+                date_format="ISO8601"
+            )
+        except FileNotFoundError:
+            existing_df = pd.DataFrame()
+
+        combined = merge_and_trim(existing_df, items)
+        combined.to_csv(OUTPUT_PATH, index=False)
+        meta["last_compacted"] = datetime.now(timezone.utc).date().isoformat()
+        print(f"Saved {len(combined)} items -> {OUTPUT_PATH}")
+
+    # Only remember the validators once the CSV holds the matching items.
+    save_feed_meta(meta)
 
 
 if __name__ == "__main__":
@@ -27,23 +27,23 @@ After running:
     streamlit run dashboard.py
 """
 
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from collectors.x_collector import collect_x_data
-from collectors.youtube_collector import collect_youtube_data
-from analyzers.influence_score import calculate_signal_score
 from config import load_artists
 import os
 
 
-def main():
+def main(chart_df=None):
     """
     Main data collection pipeline
 
+    chart_df: Chart positions already collected in this process (passed by
+    update_all.py). When None, data/chart_data.csv is loaded instead.
+
     PIPELINE STAGES:
     1. Load artists
     2. Collect X data
-    3. Collect YouTube data
+    3. Collect YouTube data (runs alongside stage 2)
     4. Calculate scores
     5. Save results
     6. Display summary
@@ -66,6 +66,13 @@ def main():
         print("   👉 Add artists to artists.json or use the dashboard")
         return
 
+    # Heavy imports (pandas, tweepy, the Google API client) wait until we
+    # know there's work to do, so the checks above fail fast
+    import pandas as pd
+    from collectors.x_collector import collect_x_data
+    from collectors.youtube_collector import collect_youtube_data
+    from analyzers.influence_score import calculate_signal_score
+
     print(f"\n👥 Tracking {len(artists)} active artists:")
     for artist in artists:
         # Show artist name and category
@@ -76,24 +83,22 @@ def main():
     os.makedirs('data', exist_ok=True)
 
     # ========================================
-    # STAGE 2: Collect X (Twitter) Data
-    # ========================================
-
-    print("\n" + "=" * 60)
-    print("📱 COLLECTING X (TWITTER) DATA")
-    print("=" * 60)
-
-    x_df = collect_x_data()
-
-    # ========================================
-    # STAGE 3: Collect YouTube Data
+    # STAGES 2 + 3: Collect X and YouTube Data
     # ========================================
 
     print("\n" + "=" * 60)
-    print("📺 COLLECTING YOUTUBE DATA")
+    print("📱📺 COLLECTING X (TWITTER) + YOUTUBE DATA")
     print("=" * 60)
 
-    yt_df = collect_youtube_data()
+    # The two collectors don't depend on each other, so run them side by side.
+    # X spends most of its time waiting out 15-minute rate-limit windows;
+    # YouTube finishes during that wait instead of queueing behind it.
+    # (Their progress lines may interleave in the output.)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        x_future = executor.submit(collect_x_data)
+        yt_future = executor.submit(collect_youtube_data)
+        x_df = x_future.result()
+        yt_df = yt_future.result()
 
     print("=" * 60)
 
@@ -123,15 +128,23 @@ def main():
 
     # Try to load chart data if it exists
     # Chart data is collected separately via update_charts.py
-    chart_df = pd.DataFrame()
-    if os.path.exists('data/chart_data.csv'):
+    if chart_df is not None:
+        # Already in memory - no need to parse the CSV we just wrote
+        print(f"\n📊 Using chart data from this run: {len(chart_df)} artists")
+    elif os.path.exists('data/chart_data.csv'):
         try:
-            chart_df = pd.read_csv('data/chart_data.csv')
+            chart_df = pd.read_csv(
+                'data/chart_data.csv',
+                dtype={'celebrity': 'category', 'category': 'category'},
+                parse_dates=['date'],
+                date_format='%Y-%m-%d'
+            )
             print(f"\n📊 Loaded chart data: {len(chart_df)} artists")
         except Exception as e:
             print(f"\n⚠️  Could not load chart data: {str(e)}")
             chart_df = pd.DataFrame()
     else:
+        chart_df = pd.DataFrame()
         print(f"\n💡 No chart data found. Run 'python update_charts.py' to collect chart data.")
 
     # ========================================
@@ -157,14 +170,15 @@ def main():
     print("=" * 60)
 
     # Display top 5 with formatted output
-    for idx, row in rankings.head(5).iterrows():
+    # enumerate gives the display rank; the sorted DataFrame keeps its
+    # original index, so idx + 1 wouldn't match the leaderboard order
+    for rank, row in enumerate(rankings.head(5).itertuples(index=False), start=1):
         # Format: "1. Taylor Swift        Score: 85.3 (Western)"
         # :<20 means left-align with 20 characters of space
         # :>5.1f means right-align with 5 characters, 1 decimal place
-        rank = idx + 1
-        name = row['celebrity']
-        score = row['signal_score']
-        category = row['category']
+        name = row.celebrity
+        score = row.signal_score
+        category = row.category
 
         print(f"{rank}. {name:<20} Score: {score:>5.1f} ({category})")
 
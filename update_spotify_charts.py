@@ -10,7 +10,6 @@ Outputs:
 """
 
 from datetime import datetime, timezone
-from io import StringIO
 import os
 
 import pandas as pd
@@ -20,15 +19,17 @@ import requests
 KWORB_GLOBAL_DAILY_URL = "https://kworb.net/spotify/country/global_daily.html"
 HISTORY_PATH = "data/spotify_global_daily_history.csv"
 LATEST_PATH = "data/spotify_global_daily_latest.csv"
+STRIP_COMMAS = str.maketrans("", "", ",")
 HEADERS = {
     "User-Agent": "Signal-Index-Bot/1.0 (Educational Project; Contact: signalindex@example.com)"
 }
 
 
 def fetch_global_daily():
-    response = requests.get(KWORB_GLOBAL_DAILY_URL, headers=HEADERS, timeout=30)
-    response.raise_for_status()
-    tables = pd.read_html(StringIO(response.text))
+    with requests.get(KWORB_GLOBAL_DAILY_URL, headers=HEADERS, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        tables = pd.read_html(response.raw, flavor="lxml", match="Pos")
     if not tables:
         raise ValueError("No tables found on Kworb page.")
     df = tables[0]
@@ -47,13 +48,11 @@ def fetch_global_daily():
     df["artist"] = artist_title[0].str.strip()
     df["title"] = artist_title[1].str.strip() if artist_title.shape[1] > 1 else None
 
-    df["rank"] = pd.to_numeric(df["rank"], errors="coerce")
-    df["streams"] = (
-        df["streams"]
-        .astype(str)
-        .str.replace(",", "", regex=False)
-    )
-    df["streams"] = pd.to_numeric(df["streams"], errors="coerce")
+    df["rank"] = pd.to_numeric(df["rank"], errors="coerce").astype("Int32")
+    df["streams"] = pd.to_numeric(
+        df["streams"].astype(str).str.translate(STRIP_COMMAS),
+        errors="coerce"
+    ).astype("Int64")
 
     df["date"] = datetime.now(timezone.utc).date().isoformat()
     df["chart"] = "spotify_global_daily"
@@ -61,44 +60,85 @@ def fetch_global_daily():
     return df[["date", "chart", "rank", "artist", "title", "streams"]]
 
 
-def load_history():
+def load_history(skip_rows=0):
     try:
-        return pd.read_csv(HISTORY_PATH)
+        return pd.read_csv(
+            HISTORY_PATH,
+            skiprows=range(1, skip_rows + 1),
+            dtype={"chart": "category", "artist": "category", "title": "category"},
+            parse_dates=["date"],
+            date_format="%Y-%m-%d"
+        )
     except FileNotFoundError:
         return pd.DataFrame()
 
 
+def load_history_columns():
+    try:
+        return list(pd.read_csv(HISTORY_PATH, nrows=0).columns)
+    except FileNotFoundError:
+        return []
+
+
+def load_history_dates():
+    return pd.read_csv(
+        HISTORY_PATH,
+        usecols=["date"],
+        parse_dates=["date"],
+        date_format="%Y-%m-%d"
+    )["date"]
+
+
+def load_last_day(history_dates):
+    last_day = history_dates.max()
+    if pd.isna(last_day):
+        return pd.DataFrame()
+    first_row = int((history_dates == last_day).to_numpy().nonzero()[0][0])
+    day_df = load_history(skip_rows=first_row)
+    return day_df[day_df["date"] == last_day]
+
+
 def save_history(history_df):
     history_df.to_csv(HISTORY_PATH, index=False)
 
 
+def append_history(latest_df):
+    write_header = not os.path.exists(HISTORY_PATH)
+    latest_df.to_csv(HISTORY_PATH, mode="a", header=write_header, index=False)
+
+
+def compact_history(history_df, latest_df):
+    combined = pd.concat([history_df, latest_df], ignore_index=True)
+    combined = combined.drop_duplicates(subset=["date", "artist", "title"], keep="last")
+    combined = combined.sort_values(["date", "rank"])
+    save_history(combined)
+    return combined
+
+
 def compute_latest(history_df):
     if history_df.empty:
         return pd.DataFrame()
 
     history_df["date"] = pd.to_datetime(history_df["date"], errors="coerce")
-    dates = sorted(history_df["date"].dropna().dt.date.unique())
-    if len(dates) < 2:
-        latest = history_df[history_df["date"].dt.date == dates[-1]].copy()
+    days = history_df["date"].dt.normalize()
+    last_two = days.drop_duplicates().nlargest(2)
+    current = history_df[days == last_two.iloc[0]]
+    if len(last_two) < 2:
+        latest = current.copy()
         latest["delta_streams"] = None
         latest["delta_rank"] = None
         return latest
 
-    current_date = dates[-1]
-    prev_date = dates[-2]
-
-    current = history_df[history_df["date"].dt.date == current_date].copy()
-    previous = history_df[history_df["date"].dt.date == prev_date].copy()
+    previous = history_df[days == last_two.iloc[1]]
 
-    previous_keyed = previous.set_index(["artist", "title"])
-    current_keyed = current.set_index(["artist", "title"])
-
-    current_keyed["prev_streams"] = previous_keyed["streams"]
-    current_keyed["prev_rank"] = previous_keyed["rank"]
-    current_keyed["delta_streams"] = current_keyed["streams"] - current_keyed["prev_streams"]
-    current_keyed["delta_rank"] = current_keyed["prev_rank"] - current_keyed["rank"]
-
-    latest = current_keyed.reset_index()
+    previous = (
+        previous[["artist", "title", "streams", "rank"]]
+        .drop_duplicates(subset=["artist", "title"], keep="last")
+        .rename(columns={"streams": "prev_streams", "rank": "prev_rank"})
+    )
+    latest = current.merge(previous, on=["artist", "title"], how="left")
+    latest["delta_streams"] = latest["streams"] - latest["prev_streams"]
+    latest["delta_rank"] = latest["prev_rank"] - latest["rank"]
     return latest
 
 
@@ -110,14 +150,28 @@ def main():
     except Exception as exc:
         print(f"Kworb fetch failed: {type(exc).__name__}: {exc}")
         return
-    history_df = load_history()
-
-    combined = pd.concat([history_df, latest_df], ignore_index=True)
-    combined = combined.drop_duplicates(subset=["date", "artist", "title"], keep="last")
-    combined = combined.sort_values(["date", "rank"])
-    save_history(combined)
+    if latest_df.empty:
+        print("Kworb returned no chart rows; history left unchanged.")
+        return
+    latest_df["date"] = pd.to_datetime(latest_df["date"])
+    today = latest_df["date"].iloc[0]
+    history_columns = load_history_columns()
+    history_dates = (
+        load_history_dates() if history_columns == list(latest_df.columns) else None
+    )
 
-    latest = compute_latest(combined)
+    # Same-day reruns and column changes need the full dedupe + rewrite.
+    if not history_columns:
+        append_history(latest_df)
+        recent = latest_df
+    elif history_dates is not None and today not in set(history_dates):
+        previous = load_last_day(history_dates)
+        append_history(latest_df)
+        recent = latest_df if previous.empty else pd.concat([previous, latest_df], ignore_index=True)
+    else:
+        recent = compact_history(load_history(), latest_df)
+
+    latest = compute_latest(recent)
     latest.to_csv(LATEST_PATH, index=False)
     print(f"Saved {len(latest)} rows -> {LATEST_PATH}")
 